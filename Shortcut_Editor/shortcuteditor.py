@@ -22,6 +22,23 @@ import os
 import sys
 import json
 import hashlib
+import stat
+import errno
+import binascii
+import operator
+import itertools
+import collections
+
+try:
+    from functools import lru_cache as _lru_cache
+except ImportError:
+    _lru_cache = None
+
+try:
+    # Faster settings load/save when available, stdlib json otherwise
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     # Prefer Qt.py when available
@@ -48,6 +65,7 @@ except ImportError:
 
 if sys.version_info[0] >= 3:
     basestring = str
+    intern = sys.intern
 
 # Debug flag for logging missing/orphaned menu items
 # Set to True to enable warnings for shortcuts that reference non-existent menu commands
@@ -63,8 +81,16 @@ DEBUG_STATS = os.environ.get('SHORTCUTEDITOR_DEBUG_STATS', '0').lower() in ('1',
 _debug_stats_printed_conflicts = False
 _debug_stats_printed_orphaned = False
 
-# Module-level cache for default shortcuts (captured before user prefs are applied)
-_default_shortcuts_cache = None
+# Module-level cache for default shortcuts (captured before user prefs are applied),
+# see _remember_default_shortcut
+_default_shortcuts_cache = {}
+
+# Nuke menu classes, looked up once for the type checks in _find_menu_items_uncached
+_NukeMenu = nuke.Menu
+_NukeMenuItem = nuke.MenuItem
+
+# Module-level cache for _find_menu_items results, keyed by top-level menu name
+_menu_items_cache = {}
 
 # Pastel color palette for status indicators (suitable for dark UI with light text)
 STATUS_COLORS = {
@@ -76,7 +102,7 @@ STATUS_COLORS = {
     'CONFLICT_BG': '#3A2525', # Subtle red-tinted background (dark)
 }
 
-def _qt_int(val):
+def _qt_int_uncached(val):
     """Helper to handle Qt6 Enums that don't cast to int directly"""
     if hasattr(val, "value"):
         return int(val.value)
@@ -85,6 +111,19 @@ def _qt_int(val):
     except (TypeError, ValueError):
         return 0
 
+if _lru_cache is not None:
+    _qt_int_cached = _lru_cache(maxsize=64)(_qt_int_uncached)
+
+    def _qt_int(val):
+        """Memoized _qt_int_uncached (falls back for unhashable Qt flag types)"""
+        try:
+            return _qt_int_cached(val)
+        except TypeError:
+            return _qt_int_uncached(val)
+else:
+    # Python 2 has no functools.lru_cache
+    _qt_int = _qt_int_uncached
+
 # Pre-calculate masks for bitwise operations
 SHIFT_MASK = _qt_int(Qt.ShiftModifier)
 CTRL_MASK  = _qt_int(Qt.ControlModifier)
@@ -92,6 +131,35 @@ ALT_MASK   = _qt_int(Qt.AltModifier)
 META_MASK  = _qt_int(Qt.MetaModifier)
 MODIFIERS_MASK = SHIFT_MASK | CTRL_MASK | ALT_MASK | META_MASK
 
+# Pre-calculate key codes used by KeySequenceButton.keyPressEvent, so the
+# per-keystroke path doesn't have to convert Qt enums every time
+_KEY_SHIFT     = _qt_int(Qt.Key_Shift)
+_KEY_CONTROL   = _qt_int(Qt.Key_Control)
+_KEY_ALT       = _qt_int(Qt.Key_Alt)
+_KEY_ALTGR     = _qt_int(Qt.Key_AltGr)
+_KEY_META      = _qt_int(Qt.Key_Meta)
+_KEY_MENU      = _qt_int(Qt.Key_Menu)
+_KEY_RETURN    = _qt_int(Qt.Key_Return)
+_KEY_SPACE     = _qt_int(Qt.Key_Space)
+_KEY_TAB       = _qt_int(Qt.Key_Tab)
+_KEY_BACKTAB   = _qt_int(Qt.Key_Backtab)
+_KEY_BACKSPACE = _qt_int(Qt.Key_Backspace)
+_KEY_DELETE    = _qt_int(Qt.Key_Delete)
+_KEY_ESCAPE    = _qt_int(Qt.Key_Escape)
+_KEY_EXCLAM    = _qt_int(Qt.Key_Exclam)
+_KEY_AT        = _qt_int(Qt.Key_At)
+_KEY_Z         = _qt_int(Qt.Key_Z)
+
+# Key classification uses frozensets: a small-int set lookup is a single hash
+# probe, and faster in CPython than a low-bits bitmask prefilter
+# Keys which are only modifiers, never appended to a key sequence
+_ALL_MODIFIERS_SET = frozenset((_KEY_SHIFT, _KEY_CONTROL, _KEY_ALTGR,
+                                _KEY_ALT, _KEY_META, _KEY_MENU))
+
+# Keys where keeping the Shift modifier makes sense (e.g Shift+Return)
+_SHIFT_SPECIAL_KEYS_SET = frozenset((_KEY_RETURN, _KEY_SPACE, _KEY_TAB, _KEY_BACKTAB,
+                                     _KEY_BACKSPACE, _KEY_DELETE, _KEY_ESCAPE))
+
 def _run_dialog(dialog):
     if hasattr(dialog, 'exec'):
         return dialog.exec()
@@ -168,6 +236,8 @@ class KeySequenceButton(QtWidgets.QPushButton):
         QtWidgets.QPushButton.__init__(self, parent)
         # self.setIcon(icons.get("configure"))
         self._modifierlessAllowed = True  # True allows "b" as a shortcut, False requires shift/alt/ctrl/etc
+        # Keys are recorded while the button has focus, rather than by grabbing the keyboard
+        self.setFocusPolicy(Qt.StrongFocus)
         self._seq = QtGui.QKeySequence()
         self._timer = QtCore.QTimer()
         self._timer.setSingleShot(True)
@@ -176,6 +246,9 @@ class KeySequenceButton(QtWidgets.QPushButton):
         self.clicked.connect(self.startRecording)
         self._timer.timeout.connect(self.doneRecording)
         self._recseq = QtGui.QKeySequence()
+        # What the button text was last built from, see updateDisplay
+        self._display_seq = None
+        self._display_state = None
 
     def setKeySequence(self, seq):
         self._seq = seq
@@ -187,6 +260,16 @@ class KeySequenceButton(QtWidgets.QPushButton):
         return self._seq
 
     def updateDisplay(self):
+        # Sequences are replaced rather than mutated, so if the same object
+        # is shown with the same modifiers the text can't have changed
+        # (e.g key release events while recording)
+        seq = self._recseq if self._isrecording else self._seq
+        state = (self._isrecording, self._modifiers)
+        if seq is self._display_seq and state == self._display_state:
+            return
+        self._display_seq = seq
+        self._display_state = state
+
         if self._isrecording:
             try:
                 s = self._recseq.toString(QtGui.QKeySequence.NativeText).replace('&', '&&')
@@ -209,7 +292,13 @@ class KeySequenceButton(QtWidgets.QPushButton):
         if self._isrecording:
             # prevent Qt from special casing Tab and Backtab
             if ev.type() == QtCore.QEvent.KeyPress:
-                self.keyPressEvent(ev)
+                # held keys repeat rapidly, drop those before any key decoding
+                if not ev.isAutoRepeat():
+                    self.keyPressEvent(ev)
+                return True
+            # stop Nuke's own shortcuts triggering while recording
+            if ev.type() == QtCore.QEvent.ShortcutOverride:
+                ev.accept()
                 return True
         return QtWidgets.QPushButton.event(self, ev)
 
@@ -224,10 +313,8 @@ class KeySequenceButton(QtWidgets.QPushButton):
 
         ev.accept()
 
-        all_modifiers = (_qt_int(Qt.Key_Shift), _qt_int(Qt.Key_Control), _qt_int(Qt.Key_AltGr),
-                            _qt_int(Qt.Key_Alt), _qt_int(Qt.Key_Meta), _qt_int(Qt.Key_Menu))
-
-        key = _qt_int(ev.key())
+        # QKeyEvent.key() is a plain int in all supported bindings
+        key = int(ev.key())
         
         # Handle unknown keys (sometimes happens with modifiers in Qt6)
         if key == -1 or key == 0:
@@ -239,35 +326,38 @@ class KeySequenceButton(QtWidgets.QPushButton):
         # check if key is a modifier or a character key without modifier (and if that is allowed)
         if (
             # don't append the key if the key is -1 (garbage) or a modifier ...
-            key not in all_modifiers
+            key not in _ALL_MODIFIERS_SET
             # or if this is the first key and without modifier and modifierless keys are not allowed
             and (self._modifierlessAllowed
                  or self._recseq.count() > 0
                  or modifiers & ~SHIFT_MASK
                  or not ev.text()
                  or (modifiers & SHIFT_MASK
-                     and key in (_qt_int(Qt.Key_Return), _qt_int(Qt.Key_Space), _qt_int(Qt.Key_Tab), _qt_int(Qt.Key_Backtab),
-                                 _qt_int(Qt.Key_Backspace), _qt_int(Qt.Key_Delete), _qt_int(Qt.Key_Escape))))):
+                     and key in _SHIFT_SPECIAL_KEYS_SET))):
 
             # change Shift+Backtab into Shift+Tab
-            if key == _qt_int(Qt.Key_Backtab) and modifiers & SHIFT_MASK:
-                key = _qt_int(Qt.Key_Tab) | modifiers
+            if key == _KEY_BACKTAB and modifiers & SHIFT_MASK:
+                key = _KEY_TAB | modifiers
 
             # remove the Shift modifier if it doen't make sense..
-            elif (_qt_int(Qt.Key_Exclam) <= key <= _qt_int(Qt.Key_At)
+            elif (_KEY_EXCLAM <= key <= _KEY_AT
                   # ... e.g ctrl+shift+! is impossible on, some,
                   # keyboards (because ! is shift+1)
-                  or _qt_int(Qt.Key_Z) < key <= 0x0ff):
+                  or _KEY_Z < key <= 0x0ff):
                 key = key | (modifiers & ~SHIFT_MASK)
 
             else:
                 key = key | modifiers
 
             # append max number of keystrokes
-            if self._recseq.count() < self.MAX_NUM_KEYSTROKES:
-                l = list(self._recseq)
-                l.append(key)
-                self._recseq = QtGui.QKeySequence(*l)
+            if self.MAX_NUM_KEYSTROKES > 1:
+                if self._recseq.count() < self.MAX_NUM_KEYSTROKES:
+                    l = list(self._recseq)
+                    l.append(key)
+                    self._recseq = QtGui.QKeySequence(*l)
+            elif self._recseq.isEmpty():
+                # single keystroke, no need to rebuild from a list
+                self._recseq = QtGui.QKeySequence(key)
 
         self._modifiers = modifiers
         self.controlTimer()
@@ -290,6 +380,12 @@ class KeySequenceButton(QtWidgets.QPushButton):
             self.cancelRecording()
         QtWidgets.QPushButton.hideEvent(self, ev)
 
+    def focusOutEvent(self, ev):
+        # Keys only arrive while focused, so stop recording when focus moves away
+        if self._isrecording:
+            self.cancelRecording()
+        QtWidgets.QPushButton.focusOutEvent(self, ev)
+
     def controlTimer(self):
         if self._modifiers or self._recseq.isEmpty():
             self._timer.stop()
@@ -297,20 +393,18 @@ class KeySequenceButton(QtWidgets.QPushButton):
             self._timer.start(600)
 
     def startRecording(self):
-        # self.setFocus(True)  # because of QTBUG 17810
         self.setDown(True)
         self.setStyleSheet("text-align: left;")
         self._isrecording = True
         self._recseq = QtGui.QKeySequence()
         app_mods = _qt_int(QtWidgets.QApplication.keyboardModifiers())
         self._modifiers = app_mods & MODIFIERS_MASK
-        self.grabKeyboard()
+        self.setFocus(Qt.ShortcutFocusReason)
         self.updateDisplay()
 
     def doneRecording(self):
         self._seq = self._recseq
         self.cancelRecording()
-        self.clearFocus()
         self.parentWidget().keySequenceChanged.emit()
 
     def cancelRecording(self):
@@ -319,22 +413,92 @@ class KeySequenceButton(QtWidgets.QPushButton):
         self.setDown(False)
         self.setStyleSheet("")
         self._isrecording = False
-        self.releaseKeyboard()
+        self.clearFocus()
         self.updateDisplay()
 
 
-def _find_menu_items(menu, _path=None, _top_menu_name=None):
+def invalidate_menu_cache():
+    """Forget the cached menu items, so the next lookup walks Nuke's menus again
+
+    Should be called if menu items are added or removed after the
+    shortcut editor has looked at them
+    """
+    _menu_items_cache.clear()
+
+
+class ShortcutDelegate(QtWidgets.QStyledItemDelegate):
+    """Edits the shortcut column of the ShortcutEditorWidget table
+
+    Cells just display the shortcut text. A KeySequenceWidget is only
+    created while a cell is being edited, rather than one per row
+    """
+
+    def __init__(self, editor_widget):
+        QtWidgets.QStyledItemDelegate.__init__(self, editor_widget)
+        self._editor_widget = editor_widget
+
+    def createEditor(self, parent, option, index):
+        menuitem = self._editor_widget.list_menu()[index.row()]
+        editor = KeySequenceWidget(parent)
+        editor.setFocusProxy(editor.button)
+        editor.setShortcut(self._editor_widget._current_shortcut(menuitem))
+        editor.keySequenceChanged.connect(lambda: self._commit(editor, menuitem))
+        # Clicking the cell is enough to start recording a new key
+        editor.button.startRecording()
+        return editor
+
+    def setEditorData(self, editor, index):
+        menuitem = self._editor_widget.list_menu()[index.row()]
+        editor.setShortcut(self._editor_widget._current_shortcut(menuitem))
+
+    def setModelData(self, editor, model, index):
+        # Nothing to do, the edit is applied by ShortcutEditorWidget.setkey
+        pass
+
+    def helpEvent(self, event, view, option, index):
+        # Tooltips are built on hover, rather than for every row up front
+        if event.type() == QtCore.QEvent.ToolTip:
+            menuitem = self._editor_widget.list_menu()[index.row()]
+            tooltip = self._editor_widget._shortcut_tooltip(menuitem)
+            if tooltip:
+                QtWidgets.QToolTip.showText(event.globalPos(), tooltip, view)
+            else:
+                QtWidgets.QToolTip.hideText()
+                event.ignore()
+            return True
+        return QtWidgets.QStyledItemDelegate.helpEvent(self, event, view, option, index)
+
+    def _commit(self, editor, menuitem):
+        # Close the editor first, as setkey may repopulate the table
+        self.closeEditor.emit(editor, QtWidgets.QAbstractItemDelegate.NoHint)
+        self._editor_widget.setkey(menuitem=menuitem, shortcut_widget=editor)
+
+
+def _find_menu_items(menu):
     """Extracts items from a given Nuke menu
 
     Returns a list of strings, with the path to each item
 
     Ignores divider lines and hidden items (ones like "@;&CopyBranch" for shift+k)
 
+    Results are cached per top-level menu, see invalidate_menu_cache
+
     >>> found = _find_menu_items(nuke.menu("Nodes"))
     >>> found.sort()
     >>> found[:5]
     ['3D/Axis', '3D/Camera', '3D/CameraTracker', '3D/DepthGenerator', '3D/Geometry/Card']
     """
+    cache_key = menu.name() or id(menu)
+    found = _menu_items_cache.get(cache_key)
+    if found is None:
+        found = _find_menu_items_uncached(menu)
+        _menu_items_cache[cache_key] = found
+    return found
+
+
+def _find_menu_items_uncached(menu, _path=None, _top_menu_name=None):
+    """Walks the given menu recursively, used by _find_menu_items
+    """
 
     if _top_menu_name is None:
         _top_menu_name = menu.name()
@@ -343,27 +507,35 @@ def _find_menu_items(menu, _path=None, _top_menu_name=None):
             # Use object id to create stable unique context identifier
             # This prevents false conflicts across different unnamed menus
             _top_menu_name = "_unnamed_menu_%x" % id(menu)
+        # Shared by every item under this menu (and used as its conflict context)
+        _top_menu_name = intern(_top_menu_name)
 
     found = []
 
     mi = menu.items()
     for i in mi:
-        if isinstance(i, nuke.Menu):
+        # Exact type checks first, isinstance only needed for subclasses
+        t = type(i)
+        if t is _NukeMenu or (t is not _NukeMenuItem and isinstance(i, _NukeMenu)):
             # Sub-menu, recurse
             mname = i.name().replace("&", "")
-            subpath = "/".join(x for x in (_path, mname) if x is not None)
-            sub_found = _find_menu_items(menu = i, _path = subpath, _top_menu_name = _top_menu_name)
+            subpath = mname if _path is None else _path + "/" + mname
+            sub_found = _find_menu_items_uncached(menu = i, _path = subpath, _top_menu_name = _top_menu_name)
             found.extend(sub_found)
-        elif isinstance(i, nuke.MenuItem):
-            if i.name() == "":
+        elif t is _NukeMenuItem or isinstance(i, _NukeMenuItem):
+            name = i.name()
+            if name == "":
                 # Skip dividers
                 continue
-            if i.name().startswith("@;"):
+            if name.startswith("@;"):
                 # Skip hidden items
                 continue
 
-            subpath = "/".join(x for x in (_path, i.name()) if x is not None)
-            found.append({'menuobj': i, 'menupath': subpath, 'top_menu_name': _top_menu_name})
+            # Interned (as is cmd_key) so repeated dict lookups are cheap
+            subpath = intern(name if _path is None else _path + "/" + name)
+            cmd_key = intern("%s/%s" % (_top_menu_name, subpath))
+            found.append({'menuobj': i, 'menupath': subpath, 'top_menu_name': _top_menu_name,
+                          'cmd_key': cmd_key})
 
     return found
 
@@ -386,6 +558,13 @@ def _load_yaml(path):
         if not os.path.isfile(path):
             print("Settings file %r does not exist" % (path))
             return
+        if orjson is not None:
+            # orjson works on UTF-8 bytes directly
+            f = open(path, 'rb')
+            overrides = orjson.loads(f.read())
+            f.close()
+            return overrides
+
         # Explicit UTF-8 for Py3 compatibility
         try:
             f = open(path, 'r', encoding='utf-8')
@@ -415,6 +594,9 @@ def _normalize_shortcut(shortcut):
     """
     if shortcut is None:
         return ""
+    if hasattr(shortcut, 'isEmpty') and shortcut.isEmpty():
+        # Empty QKeySequence (most menu items), skip the toString conversion
+        return ""
     if hasattr(shortcut, 'toString'):
         # QKeySequence object
         result = shortcut.toString()
@@ -431,37 +613,87 @@ def _normalize_shortcut(shortcut):
     return result
 
 
+def _remember_default_shortcut(cmd_key, menu_item):
+    """Record a menu item's current shortcut as its default, unless one is already
+    recorded. Must be called before shortcuteditor first changes the item's shortcut
+
+    Returns the item's current (normalized) shortcut
+    """
+    current = _normalize_shortcut(menu_item.action().shortcut())
+    _default_shortcuts_cache.setdefault(cmd_key, current)
+    return current
+
+
 def _capture_default_shortcuts():
-    """Capture default shortcuts from all menu items before user prefs are applied.
+    """Capture default shortcuts for all menu items not yet recorded.
     
-    Returns a dict mapping command identifiers (menu_name/path) to their
-    default shortcut strings. This snapshot can be used to determine if
-    a shortcut has been changed by the user.
+    Fills the module-level _default_shortcuts_cache, mapping command
+    identifiers (menu_name/path) to their default shortcut strings. This
+    snapshot can be used to determine if a shortcut has been changed by the user.
     
-    Note: This should be called before user preferences are restored,
-    otherwise it will capture shortcuts that already include user changes.
+    Items with user preferences already had their default recorded by
+    _restore_overrides, before the user shortcut was applied. Every other
+    item is still on its default, so this can safely run later (it is
+    called when the editor UI opens, rather than during Nuke startup).
     """
-    defaults = {}
-    
     for menu_name in ("Nodes", "Nuke", "Viewer", "Node Graph"):
         try:
             m = nuke.menu(menu_name)
-            if m:
-                items = _find_menu_items(m)
-                for item in items:
-                    try:
-                        raw_shortcut = item['menuobj'].action().shortcut()
-                        shortcut_str = _normalize_shortcut(raw_shortcut)
-                        cmd_key = "%s/%s" % (item['top_menu_name'], item['menupath'])
-                        defaults[cmd_key] = shortcut_str
-                    except Exception:
-                        # Skip items that can't be accessed
-                        continue
+            if not m:
+                continue
+            pending = [item for item in _find_menu_items(m)
+                       if item['cmd_key'] not in _default_shortcuts_cache]
         except Exception:
             # Skip menus that don't exist or can't be accessed
             continue
-    
-    return defaults
+
+        # Read all shortcuts in one go, with a single try for the whole batch
+        try:
+            shortcuts = [item['menuobj'].action().shortcut() for item in pending]
+        except Exception:
+            shortcuts = None
+
+        if shortcuts is not None:
+            for item, raw_shortcut in zip(pending, shortcuts):
+                _default_shortcuts_cache[item['cmd_key']] = _normalize_shortcut(raw_shortcut)
+        else:
+            # Some item couldn't be accessed, go one by one so only it is skipped
+            for item in pending:
+                try:
+                    _remember_default_shortcut(item['cmd_key'], item['menuobj'])
+                except Exception:
+                    continue
+
+
+if hasattr(os, 'replace'):
+    _replace_file = os.replace
+elif os.name == 'nt':
+    def _replace_file(src, dst):
+        """Python 2 fallback for os.replace (os.rename won't overwrite on Windows)
+        """
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+else:
+    # On POSIX, os.rename already replaces dst atomically
+    _replace_file = os.rename
+
+
+def _create_temp_file(target):
+    """Create a uniquely named file next to target, returning (fd, path)
+
+    Created with os.open (rather than tempfile.mkstemp) so the new file gets
+    the usual umask-based permissions
+    """
+    while True:
+        tmp_path = "%s.%s.tmp" % (target, binascii.hexlify(os.urandom(6)).decode('ascii'))
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+        except OSError as e:
+            if e.errno == errno.EEXIST:
+                continue
+            raise
+        return fd, tmp_path
 
 
 def _save_yaml(obj, path):
@@ -474,16 +706,50 @@ def _save_yaml(obj, path):
                 if e.errno != 17:  # errno 17 is "already exists"
                     raise
 
-        # Explicit UTF-8 for Py3 compatibility
-        try:
-            f = open(path, "w", encoding='utf-8')
-        except TypeError:
-            f = open(path, "w")
-
         # TODO: Limit number of saved items to some sane number
-        json.dump(obj, fp=f, sort_keys=True, indent=1, separators=(',', ': '))
-        f.write("\n")
-        f.close()
+        if orjson is not None:
+            new_bytes = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+        else:
+            # Same bytes as orjson writes, so the unchanged check below still
+            # matches when Nuke versions with and without orjson share a file
+            new_bytes = (json.dumps(obj, sort_keys=True, indent=2, ensure_ascii=False, separators=(',', ': ')) + "\n").encode('utf-8')
+
+        # Write through a symlinked settings file (the replace below would
+        # otherwise swap the link itself for a regular file)
+        target = os.path.realpath(path)
+
+        # Skip the write entirely if nothing changed (e.g closing the UI without edits)
+        if os.path.isfile(target):
+            f = open(target, "rb")
+            old_bytes = f.read()
+            f.close()
+            if old_bytes == new_bytes:
+                return
+
+        # Write to a uniquely named temporary file and move it into place, so
+        # a crash (or another Nuke saving at the same time) can't leave a
+        # truncated or interleaved file
+        fd, tmp_path = _create_temp_file(target)
+        try:
+            f = os.fdopen(fd, "wb")
+            try:
+                f.write(new_bytes)
+                f.flush()
+                os.fsync(f.fileno())
+            finally:
+                f.close()
+            # Keep the old file's permissions (a new file keeps the umask-based
+            # ones it was created with)
+            if os.path.isfile(target):
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(target).st_mode))
+            _replace_file(tmp_path, target)
+        except Exception:
+            # Don't leave the temporary file behind
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
 
     # Catch any errors, print traceback and continue
     try:
@@ -530,9 +796,21 @@ def _restore_overrides(overrides):
             if DEBUG_MISSING_ITEMS:
                 missing_items.add((path, menu_name))
         else:
-            # Menu item exists - apply the shortcut
+            # Menu item exists - record the default before first changing it.
+            # Failing to read it must not
+            # stop the override being applied
+            try:
+                current = _remember_default_shortcut(item_key, menu_item)
+            except Exception:
+                current = None  # Unknown
+
+            # Apply the shortcut
             try:
-                menu_item.setShortcut(shortcut_key)
+                # Skip no-op updates (e.g restoring again when the editor UI opens),
+                # setShortcut makes Qt rebuild its shortcut map. If the current
+                # shortcut is unknown, always apply
+                if current is None or current != _normalize_shortcut(shortcut_key):
+                    menu_item.setShortcut(shortcut_key)
             except Exception:
                 # If setShortcut fails, log it if debug is enabled
                 if DEBUG_MISSING_ITEMS:
@@ -544,21 +822,29 @@ def _restore_overrides(overrides):
             nuke.warning("ShortcutEditor: Menu item %r (menu: %r) does not exist, skipping shortcut" % (path, menu_name))
 
 
+# Templates for the snippet generated by _overrides_as_code
+_SNIPPET_MENU = "cur_menu = nuke.menu(%r)"
+_SNIPPET_ITEM = (
+    "m = cur_menu.findItem(%r)\n"
+    "if m is not None:\n"
+    "    m.setShortcut(%r)\n")
+
+
 def _overrides_as_code(overrides):
-    menus = {}
+    entries = []
     for item, key in overrides.items():
         menu_name, _, path = item.partition("/")
+        entries.append((menu_name, path, key))
 
-        menus.setdefault(menu_name, []).append((path, key))
+    # Stable sort by menu name only, so each menu's items keep their order
+    by_menu = operator.itemgetter(0)
+    entries.sort(key=by_menu)
 
     lines = []
-    for menu, things in menus.items():
-        lines.append("cur_menu = nuke.menu(%r)" % menu)
-        for path, key in things:
-            lines.append("m = cur_menu.findItem(%r)" % path)
-            lines.append("if m is not None:")
-            lines.append("    m.setShortcut(%r)" % key)
-            lines.append("")
+    for menu, things in itertools.groupby(entries, key=by_menu):
+        lines.append(_SNIPPET_MENU % menu)
+        for _, path, key in things:
+            lines.append(_SNIPPET_ITEM % (path, key))
     return "\n".join(lines)
 
 
@@ -584,6 +870,7 @@ class Overrides(object):
 
     def clear(self):
         self.overrides = {}
+        self.overrides_normalized = {}
         self.save()
 
     def load_settings_file(self):
@@ -597,21 +884,18 @@ class Overrides(object):
     def restore(self):
         """Load the settings from disc, and update Nuke
         
-        Captures default shortcuts before applying user preferences,
-        storing them in the module-level cache for use by the UI widget.
+        The default shortcut of each overridden item is recorded (in the
+        module-level cache used by the UI widget) just before the user
+        preference is applied to it.
         """
-        global _default_shortcuts_cache
-        
-        # Only capture defaults if cache is empty (first time, before user prefs applied)
-        # If cache already exists, don't overwrite it (it contains true defaults)
-        if _default_shortcuts_cache is None:
-            # Capture defaults BEFORE applying user prefs
-            _default_shortcuts_cache = _capture_default_shortcuts()
+        # Menus may have changed since they were last walked
+        invalidate_menu_cache()
         
         settings = _load_yaml(path=self.settings_path)
 
         # Default
         self.overrides = {}
+        self.overrides_normalized = {}
         self.ui_prefs = {}
 
         if settings is None:
@@ -619,6 +903,9 @@ class Overrides(object):
 
         elif int(settings['version']) == 1:
             self.overrides = settings['overrides']
+            # Normalized once here, so the UI can compare shortcuts with plain string equality
+            self.overrides_normalized = {
+                k: _normalize_shortcut(v) for (k, v) in self.overrides.items()}
             # Load UI preferences if they exist (backwards compatible)
             if 'ui' in settings and isinstance(settings['ui'], dict):
                 self.ui_prefs = settings['ui']
@@ -640,16 +927,29 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
         # Load settings from disc, and into Nuke
         self.settings = Overrides()
         self.settings.restore()
+        # Defaults are only needed by the UI, so only captured now
+        _capture_default_shortcuts()
 
         # Window setup
         self.setWindowTitle("Shortcut editor")
         self.setMinimumSize(600, 500)
 
         # Internal things
-        self._search_timer = None
+        # Single-shot timer, restarted on each edit of the search box
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self.filter_entries)
         self._cache_items = None
-        # Track which commands are in user prefs (changed shortcuts)
-        self._user_prefs_map = self.settings.overrides.copy()
+        self._row_for_item = {}
+        self._shortcut_to_items = collections.defaultdict(list)
+        self._row_hidden_state = None
+        self._last_filter_state = None
+        self._conflict_index = None
+        self._conflicts_cache = None
+        self._effective_cache = {}
+        # Track which commands are in user prefs (changed shortcuts),
+        # with shortcuts already normalized for comparison
+        self._user_prefs_map = self.settings.overrides_normalized
 
         # Stack widgets atop each other
         layout = QtWidgets.QVBoxLayout()
@@ -718,6 +1018,12 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
         table.horizontalHeader().setStretchLastSection(True)  # Menu location
         table.verticalHeader().setVisible(False)
 
+        # Shortcuts are edited with a KeySequenceWidget, created on demand
+        # by the delegate when a shortcut cell is clicked (or F2 pressed)
+        table.setItemDelegateForColumn(0, ShortcutDelegate(self))
+        table.setEditTriggers(QtWidgets.QAbstractItemView.EditKeyPressed)
+        table.cellClicked.connect(self._edit_cell)
+
         self.table = table
         layout.addWidget(table)
 
@@ -747,15 +1053,8 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
         Gives a slight delay between filtering the list, so quickly
         typing doesn't update once for every letter
         """
-        if self._search_timer is not None:
-            # Timer already set, reset
-            self._search_timer.stop()
-            self._search_timer.start(200)
-        else:
-            self._search_timer = QtCore.QTimer()
-            self._search_timer.setSingleShot(True)
-            self._search_timer.timeout.connect(self.filter_entries)
-            self._search_timer.start(200)  # 200ms timeout
+        # (Re)starting an active timer resets its 200ms timeout
+        self._search_timer.start(200)
 
     def is_changed(self, menuitem):
         """Determine if a shortcut has been changed by the user.
@@ -777,9 +1076,8 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
         
         Returns True if the shortcut has been changed, False otherwise.
         """
-        cmd_key = "%s/%s" % (menuitem['top_menu_name'], menuitem['menupath'])
         # If command is in user prefs, it's been changed (user interacted with it)
-        return cmd_key in self._user_prefs_map
+        return menuitem['cmd_key'] in self._user_prefs_map
 
     def get_change_status(self, menuitem):
         """Compute the change status for a menu item.
@@ -792,66 +1090,77 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
         - REPLACED: user shortcut differs from default (both non-empty and different)
         - UNCHANGED: same as default (no user override, or override matches default)
         """
-        global _default_shortcuts_cache
-        
-        cmd_key = "%s/%s" % (menuitem['top_menu_name'], menuitem['menupath'])
-        
-        # Get default shortcut (normalized)
-        default_shortcut = ""
-        if _default_shortcuts_cache and cmd_key in _default_shortcuts_cache:
-            default_shortcut = _normalize_shortcut(_default_shortcuts_cache[cmd_key])
-        
-        # Get user shortcut (normalized) - empty string if not in user prefs
-        user_shortcut = ""
-        if cmd_key in self._user_prefs_map:
-            user_shortcut = _normalize_shortcut(self._user_prefs_map[cmd_key])
-        
-        # Determine status
-        if cmd_key not in self._user_prefs_map:
+        cmd_key = menuitem['cmd_key']
+
+        # Both maps hold pre-normalized strings (see Overrides.restore and
+        # _capture_default_shortcuts), so no normalization needed here
+        user_shortcut = self._user_prefs_map.get(cmd_key)
+        if user_shortcut is None:
             # No user override - unchanged
             return 'UNCHANGED'
-        
-        # User has an override entry
-        if not default_shortcut and user_shortcut:
+
+        default_shortcut = _default_shortcuts_cache.get(cmd_key, "")
+
+        if user_shortcut == default_shortcut:
+            # User override matches default (redundant override), or both empty
+            return 'UNCHANGED'
+        elif not default_shortcut:
             # Default was empty, user added one
             return 'ADDED'
-        elif default_shortcut and not user_shortcut:
+        elif not user_shortcut:
             # Default had one, user cleared it
             return 'CLEARED'
-        elif default_shortcut and user_shortcut:
-            if default_shortcut == user_shortcut:
-                # User override matches default (redundant override)
-                return 'UNCHANGED'
-            else:
-                # User changed it to something different
-                return 'REPLACED'
         else:
-            # Both empty - unchanged
-            return 'UNCHANGED'
+            # User changed it to something different
+            return 'REPLACED'
+
+    def _update_status(self, menuitem):
+        """Store the change status on the menu item, for use when filtering
+
+        Must be called again whenever the item's user shortcut changes.
+        """
+        status = self.get_change_status(menuitem)
+        menuitem['_status'] = status
+        menuitem['_changed'] = status != 'UNCHANGED'
 
     def get_effective_shortcut(self, menuitem):
         """Get the effective shortcut for a menu item.
         
         Returns the user shortcut if present, otherwise the default shortcut.
         Normalized for comparison.
+
+        Cached per command in self._effective_cache, which must be updated
+        when the item's user shortcut changes.
         """
-        global _default_shortcuts_cache
-        
-        cmd_key = "%s/%s" % (menuitem['top_menu_name'], menuitem['menupath'])
-        
-        # Check user prefs first
-        if cmd_key in self._user_prefs_map:
-            return _normalize_shortcut(self._user_prefs_map[cmd_key])
-        
-        # Fall back to default
-        if _default_shortcuts_cache and cmd_key in _default_shortcuts_cache:
-            return _normalize_shortcut(_default_shortcuts_cache[cmd_key])
-        
-        # Orphaned command - get from menuitem if available
-        if menuitem.get('orphaned', False):
-            return _normalize_shortcut(menuitem.get('shortcut_str', ''))
-        
-        return ""
+        cmd_key = menuitem['cmd_key']
+        try:
+            return self._effective_cache[cmd_key]
+        except KeyError:
+            pass
+
+        # Check user prefs first, then fall back to default (both already normalized)
+        effective = self._user_prefs_map.get(cmd_key)
+        if effective is None:
+            effective = _default_shortcuts_cache.get(cmd_key)
+        if effective is None:
+            if menuitem.get('orphaned', False):
+                # Orphaned command - get from menuitem if available
+                effective = _normalize_shortcut(menuitem.get('shortcut_str', ''))
+            else:
+                effective = ""
+
+        self._effective_cache[cmd_key] = effective
+        return effective
+
+    def _conflict_key(self, menuitem):
+        """Returns the (context, effective_shortcut) key used by the conflict
+        index, or None if the item has no shortcut
+        """
+        effective = self.get_effective_shortcut(menuitem)
+        if not effective:
+            return None
+        # Context is precomputed by list_menu
+        return (menuitem['context'], effective)
 
     def detect_conflicts(self, menu_items):
         """Detect conflicts where multiple commands share the same effective shortcut.
@@ -860,37 +1169,50 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
         in different contexts (e.g., "Node Graph" vs "Viewer") without conflict.
         A conflict only occurs when the same shortcut is used multiple times
         within the same context.
+
+        Rebuilds self._conflict_index, which maps (context, effective_shortcut)
+        to the menu items using it. After this, _update_conflict_index keeps
+        it current as individual shortcuts are edited.
         
-        Returns a dict mapping command keys to lists of conflicting command keys
-        (within the same context). Only includes shortcuts that are non-empty.
+        Returns a dict mapping command keys to a tuple of all command keys sharing
+        that shortcut in the same context, including the command itself (so each
+        group is stored once). Only includes shortcuts that are non-empty.
         """
-        # Build map: (context, effective_shortcut) -> list of command keys
-        context_shortcut_to_commands = {}
+        index = collections.defaultdict(list)
         
+        conflict_key = self._conflict_key  # Local lookup, called once per item
         for menuitem in menu_items:
-            cmd_key = "%s/%s" % (menuitem['top_menu_name'], menuitem['menupath'])
-            # Get context, ensuring it's never None/empty (use stable unique ID if needed)
-            context = menuitem.get('top_menu_name')
-            if not context:
-                # Fallback: create stable unique ID from cmd_key using SHA1
-                context = "_unnamed_context_%s" % hashlib.sha1(cmd_key.encode("utf-8")).hexdigest()[:10]
-            effective = self.get_effective_shortcut(menuitem)
-            
+            key = conflict_key(menuitem)
+            menuitem['_conflict_key'] = key
             # Ignore empty shortcuts
-            if effective:
-                context_shortcut_key = (context, effective)
-                if context_shortcut_key not in context_shortcut_to_commands:
-                    context_shortcut_to_commands[context_shortcut_key] = []
-                context_shortcut_to_commands[context_shortcut_key].append(cmd_key)
-        
-        # Build conflict map: command -> list of conflicting commands (same context only)
+            if key is not None:
+                index[key].append(menuitem)
+
+        self._conflict_index = index
+        self._conflicts_cache = None
+        return self._conflicts_from_index()
+
+    def _conflicts_from_index(self):
+        """Build the conflict map returned by detect_conflicts from the current
+        conflict index
+
+        Cached in self._conflicts_cache until the index changes. Builds the
+        index first if detect_conflicts hasn't run yet.
+        """
+        if self._conflict_index is None:
+            return self.detect_conflicts(self.list_menu())
+        if self._conflicts_cache is not None:
+            return self._conflicts_cache
+
+        # Build conflict map: command -> commands sharing its shortcut (same context only)
         conflicts = {}
-        for (context, shortcut), cmd_keys in context_shortcut_to_commands.items():
-            if len(cmd_keys) > 1:
-                # This shortcut has conflicts within this context
-                for cmd_key in cmd_keys:
-                    # List all other commands sharing this shortcut in the same context
-                    conflicts[cmd_key] = [c for c in cmd_keys if c != cmd_key]
+        for bucket in self._conflict_index.values():
+            if len(bucket) > 1:
+                # This shortcut has conflicts within this context. Every member
+                # shares the one group tuple; rows filter themselves out
+                group = tuple(item['cmd_key'] for item in bucket)
+                for cmd_key in group:
+                    conflicts[cmd_key] = group
         
         # Debug statistics logging (at most once per session)
         global _debug_stats_printed_conflicts
@@ -899,8 +1221,44 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
             print("ShortcutEditor: %d conflicts detected across all contexts" % conflict_count)
             _debug_stats_printed_conflicts = True
         
+        self._conflicts_cache = conflicts
         return conflicts
 
+    def _update_conflict_index(self, menuitem):
+        """Move an edited menu item to the conflict index bucket for its new shortcut
+
+        Returns the menu items whose conflicts may have changed: the item
+        itself, plus the others in its old and new buckets.
+        """
+        if self._conflict_index is None:
+            # Not built yet, it will be built with the change already applied
+            # (see _conflicts_from_index)
+            return [menuitem]
+        self._conflicts_cache = None
+        affected = [menuitem]
+
+        old_key = menuitem.get('_conflict_key')
+        if old_key is not None:
+            bucket = [item for item in self._conflict_index.get(old_key, ()) if item is not menuitem]
+            affected.extend(bucket)
+            if bucket:
+                self._conflict_index[old_key] = bucket
+            else:
+                self._conflict_index.pop(old_key, None)
+
+        new_key = self._conflict_key(menuitem)
+        menuitem['_conflict_key'] = new_key
+        if new_key is not None:
+            affected.extend(self._conflict_index[new_key])
+            self._conflict_index[new_key].append(menuitem)
+        return affected
+
+    def _is_conflicted(self, menuitem):
+        """True if the item's shortcut is shared with another item in the same context
+        """
+        key = menuitem.get('_conflict_key')
+        return key is not None and len(self._conflict_index.get(key, ())) > 1
+
     def on_show_changed_toggled(self, state):
         """Handle the "Show User-Altered Shortcuts" checkbox toggle.
         
@@ -939,53 +1297,58 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
         menu_items = self.list_menu()
         show_only_changed = self.show_changed_checkbox.isChecked()
         show_only_conflicts = self.show_conflicts_checkbox.isChecked()
+        search_text = self.search_input.text()
+        filter_str = self.key_filter.shortcut().toString()
+
+        # Nothing to do if no filter input changed since the last pass.
+        # populate() and setkey reset this, as they change the rows themselves
+        state = (search_text, filter_str, show_only_changed, show_only_conflicts, id(menu_items))
+        if state == self._last_filter_state:
+            return
+        self._last_filter_state = state
         
-        # Detect conflicts once if needed for filtering
-        conflicts = None
-        if show_only_conflicts:
-            conflicts = self.detect_conflicts(menu_items)
+        # Build the conflict index once if needed for filtering
+        if show_only_conflicts and self._conflict_index is None:
+            self.detect_conflicts(menu_items)
         
         # Ensure we have enough rows in the table
         current_row_count = self.table.rowCount()
         if len(menu_items) > current_row_count:
             self.table.setRowCount(len(menu_items))
 
-        for rownum, menuitem in enumerate(menu_items):
-            # filter them, first by the input text
-            search = self.search_input.text()
-            found = search.lower() in menuitem['menupath'].lower().replace("&", "")
-
-            # ..and also filter by the shortcut, if one is specified
-            key_match = True
-            filter_seq = self.key_filter.shortcut()
-            if not filter_seq.isEmpty():
-                # Handle orphaned commands (no menuobj)
-                if menuitem.get('orphaned', False):
-                    shortcut_str = menuitem.get('shortcut_str', '')
-                    current_sc = QtGui.QKeySequence(shortcut_str)
-                else:
-                    current_sc = menuitem['menuobj'].action().shortcut()
-                    if isinstance(current_sc, basestring):
-                        current_sc = QtGui.QKeySequence(current_sc)
-                
-                key_match = current_sc == filter_seq
-
-            # Filter by "show only changed" if enabled
-            changed_match = True
-            if show_only_changed:
-                status = self.get_change_status(menuitem)
-                # Show only ADDED, CLEARED, REPLACED (not UNCHANGED)
-                changed_match = status != 'UNCHANGED'
-
-            # Filter by "show only conflicts" if enabled
-            conflict_match = True
-            if show_only_conflicts:
-                cmd_key = "%s/%s" % (menuitem['top_menu_name'], menuitem['menupath'])
-                conflict_match = cmd_key in conflicts
-
-            keep_result = all([found, key_match, changed_match, conflict_match])
-            # Explicitly show/hide each row based on filter result
-            self.table.setRowHidden(rownum, not keep_result)
+        # These don't change while looping over the rows
+        search_lower = search_text.lower()
+        # Bound once, as local lookups are cheaper inside the loop
+        is_conflicted = self._is_conflicted
+        set_row_hidden = self.table.setRowHidden
+
+        # Only rows whose visibility changed since the last pass are touched.
+        # Reset by populate(), after which every row is set once
+        hidden_state = self._row_hidden_state
+        if hidden_state is None or len(hidden_state) != len(menu_items):
+            hidden_state = self._row_hidden_state = [None] * len(menu_items)
+
+        self.table.setUpdatesEnabled(False)
+        try:
+            for rownum, menuitem in enumerate(menu_items):
+                # Checks go cheapest first, so a row rejected by the text search
+                # never reaches the key sequence comparison
+                keep_result = (
+                    # filter them, first by the input text
+                    (not search_lower or search_lower in menuitem['_menupath_norm'])
+                    # "show only conflicts" / "show only changed" toggles
+                    # (ADDED, CLEARED, REPLACED - not UNCHANGED)
+                    and (not show_only_conflicts or is_conflicted(menuitem))
+                    and (not show_only_changed or menuitem['_changed'])
+                    # ..and also filter by the shortcut, if one is specified
+                    and (not filter_str or menuitem['_shortcut_str'] == filter_str))
+                # Explicitly show/hide each row based on filter result
+                hidden = not keep_result
+                if hidden_state[rownum] is not hidden:
+                    set_row_hidden(rownum, hidden)
+                    hidden_state[rownum] = hidden
+        finally:
+            self.table.setUpdatesEnabled(True)
         
         # Ensure any extra rows beyond menu_items are hidden
         for rownum in range(len(menu_items), self.table.rowCount()):
@@ -1009,10 +1372,8 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
                 if m:
                     menu_items = _find_menu_items(m)
                     items.extend(menu_items)
-                    # Track which commands exist
-                    for item in menu_items:
-                        cmd_key = "%s/%s" % (item['top_menu_name'], item['menupath'])
-                        existing_cmd_keys.add(cmd_key)
+                    # Track which commands exist (cmd_key is precomputed by _find_menu_items)
+                    existing_cmd_keys.update(item['cmd_key'] for item in menu_items)
             
             # Add orphaned/missing commands from user prefs
             orphaned_count = 0
@@ -1028,11 +1389,28 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
                         'menuobj': None,  # No menu object for orphaned commands
                         'menupath': path,
                         'top_menu_name': menu_name,
+                        'cmd_key': cmd_key,
                         'orphaned': True,  # Mark as orphaned
                         'shortcut_str': shortcut_str  # Store the shortcut from prefs
                     })
                     orphaned_count += 1
             
+            # Compute conflict context, search text and change status once,
+            # rather than per filter pass. Always recomputed, as items from the
+            # menu cache may carry values from another session's prefs; setkey
+            # updates edited ones afterwards
+            self._row_for_item = {}
+            self._shortcut_to_items = collections.defaultdict(list)
+            for rownum, item in enumerate(items):
+                self._row_for_item[id(item)] = rownum
+                item['_menupath_norm'] = item['menupath'].lower().replace("&", "")
+                # Ensure context is never None/empty (use stable unique ID from cmd_key if needed)
+                item['context'] = item['top_menu_name'] or (
+                    "_unnamed_context_%s" % hashlib.sha1(item['cmd_key'].encode("utf-8")).hexdigest()[:10])
+                self._update_status(item)
+                # The shortcut may have been changed outside the editor
+                self._update_shortcut_str(item)
+
             # Debug statistics logging (at most once per session)
             global _debug_stats_printed_orphaned
             if DEBUG_STATS and not _debug_stats_printed_orphaned:
@@ -1040,32 +1418,75 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
                 _debug_stats_printed_orphaned = True
             
             self._cache_items = items
+            # Index refers to the previous item list
+            self._conflict_index = None
+            self._conflicts_cache = None
+            self._effective_cache = {}
             return items
 
-    def _create_status_badge(self, status):
-        """Create a status label with text color only (no background).
+    def _create_status_item(self, status):
+        """Create a status table item with text color only (no background).
         
-        For UNCHANGED: returns empty label (blank cell).
-        For ADDED/CLEARED/REPLACED: returns label with colored text only.
+        For UNCHANGED: returns empty item (blank cell).
+        For ADDED/CLEARED/REPLACED: returns item with colored bold text only.
         """
+        item = QtWidgets.QTableWidgetItem()
+        item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+        item.setTextAlignment(Qt.AlignCenter)
         if status == 'UNCHANGED':
-            # Return empty label for UNCHANGED
-            return QtWidgets.QLabel("")
+            # Leave blank for UNCHANGED
+            return item
         
-        label = QtWidgets.QLabel(status)
+        item.setText(status)
         color = STATUS_COLORS.get(status, STATUS_COLORS['UNCHANGED'])
-        # Use text color only, no background, with padding for readability
-        label.setStyleSheet(
-            "color: %s; "
-            "font-size: 10px; "
-            "font-weight: bold; "
-            "padding: 2px 4px; "
-            "margin: 1px;" % color
-        )
-        label.setAlignment(Qt.AlignCenter)
-        # Ensure label has proper size hint for column auto-sizing
-        label.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
-        return label
+        item.setForeground(QtGui.QColor(color))
+        font = item.font()
+        font.setBold(True)
+        font.setPixelSize(10)
+        item.setFont(font)
+        return item
+
+    def _current_shortcut(self, menuitem):
+        """Returns the shortcut currently shown for a row, as a QKeySequence
+        """
+        if menuitem.get('orphaned', False):
+            # Orphaned command - use shortcut from prefs. The sequence is kept
+            # with the string it was built from, so an edit (see setkey) rebuilds it
+            shortcut_str = menuitem.get('shortcut_str', '')
+            cached = menuitem.get('_qks')
+            if cached is None or cached[0] != shortcut_str:
+                cached = menuitem['_qks'] = (shortcut_str, QtGui.QKeySequence(shortcut_str))
+            return cached[1]
+        shortcut = menuitem['menuobj'].action().shortcut()
+        if isinstance(shortcut, QtGui.QKeySequence):
+            # Usually already a QKeySequence, no need to copy it
+            return shortcut
+        return QtGui.QKeySequence(shortcut)
+
+    def _update_shortcut_str(self, menuitem):
+        """Store the item's current shortcut as a string, for the key filter,
+        and keep self._shortcut_to_items in step with it
+        """
+        old_str = menuitem.get('_shortcut_str')
+        new_str = self._current_shortcut(menuitem).toString()
+        menuitem['_shortcut_str'] = new_str
+        # Orphaned items can't have active shortcuts, so setkey never needs them
+        if menuitem.get('orphaned', False):
+            return
+        if old_str in self._shortcut_to_items:
+            bucket = [item for item in self._shortcut_to_items[old_str] if item is not menuitem]
+            if bucket:
+                self._shortcut_to_items[old_str] = bucket
+            else:
+                del self._shortcut_to_items[old_str]
+        if new_str:
+            self._shortcut_to_items[new_str].append(menuitem)
+
+    def _edit_cell(self, row, column):
+        """Start editing a shortcut when its cell is clicked
+        """
+        if column == 0:
+            self.table.editItem(self.table.item(row, 0))
 
     def _create_conflict_tooltip(self, conflicting_commands):
         """Create a conflict tooltip text."""
@@ -1078,93 +1499,93 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
             tooltip += "\n  ... and %d more" % (len(conflicting_commands) - 5)
         return tooltip
 
+    def _shortcut_tooltip(self, menuitem):
+        """Tooltip text for a row's shortcut cell, or "" for none
+        """
+        cmd_key = menuitem['cmd_key']
+        group = self._conflicts_from_index().get(cmd_key)
+        conflicting_commands = [c for c in group if c != cmd_key] if group else []
+        conflict_tooltip = self._create_conflict_tooltip(conflicting_commands)
+
+        if menuitem.get('orphaned', False):
+            # Allow editing orphaned commands so user can clear them from preferences
+            base_tooltip = "This menu command no longer exists in Nuke. You can clear the shortcut to remove it from preferences."
+            if conflict_tooltip:
+                return "%s\n\n%s" % (base_tooltip, conflict_tooltip)
+            return base_tooltip
+        return conflict_tooltip
+
     def populate(self):
         # Get menu items (includes orphaned commands)
         menu_items = self.list_menu()
         
-        # Detect conflicts
-        conflicts = self.detect_conflicts(menu_items)
-
-        # Setup table
-        self.table.clear()
-        self.table.setRowCount(len(menu_items))
-        self.table.setHorizontalHeaderLabels(['Shortcut', 'Status', 'Menu location'])
-
-        # Add items
-        for rownum, menuitem in enumerate(menu_items):
-            cmd_key = "%s/%s" % (menuitem['top_menu_name'], menuitem['menupath'])
-            status = self.get_change_status(menuitem)
-            conflicting_commands = conflicts.get(cmd_key, [])
-            conflict_tooltip = self._create_conflict_tooltip(conflicting_commands)
-            
-            # Handle orphaned commands (no menuobj)
-            if menuitem.get('orphaned', False):
-                # Orphaned command - use shortcut from prefs
-                shortcut_str = menuitem.get('shortcut_str', '')
-                shortcut = QtGui.QKeySequence(shortcut_str)
-                
-                widget = KeySequenceWidget()
-                widget.setShortcut(shortcut)
-                # Allow editing orphaned commands so user can clear them from preferences
-                base_tooltip = "This menu command no longer exists in Nuke. You can clear the shortcut to remove it from preferences."
-                if conflict_tooltip:
-                    widget.setToolTip("%s\n\n%s" % (base_tooltip, conflict_tooltip))
-                else:
-                    widget.setToolTip(base_tooltip)
-                
-                self.table.setCellWidget(rownum, 0, widget)  # Shortcut column
-                
-                # Connect signal so user can clear orphaned shortcuts
-                widget.keySequenceChanged.connect(lambda menu_item=menuitem, w=widget: self.setkey(menuitem=menu_item,
-                                                                                                   shortcut_widget=w))
-            else:
-                # Normal menu item
-                raw_shortcut = menuitem['menuobj'].action().shortcut()
-                shortcut = QtGui.QKeySequence(raw_shortcut)
-
-                widget = KeySequenceWidget()
-                widget.setShortcut(shortcut)
-                
-                # Always set tooltip (empty string clears it if no conflicts)
-                # This ensures tooltips update immediately when conflicts are resolved
-                widget.setToolTip(conflict_tooltip if conflict_tooltip else "")
+        # Detect conflicts (the index is kept up to date by setkey once built)
+        conflicts = self._conflicts_from_index()
 
-                self.table.setCellWidget(rownum, 0, widget)  # Shortcut column
+        # Hold off repaints and the table's own signals while every row is
+        # rebuilt, so the view lays out and paints once at the end
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            # Setup table
+            self.table.clear()
+            # filter_entries re-applies every row
+            self._row_hidden_state = None
+            self._last_filter_state = None
+            self.table.setRowCount(len(menu_items))
+            self.table.setHorizontalHeaderLabels(['Shortcut', 'Status', 'Menu location'])
+
+            # Add items
+            for rownum, menuitem in enumerate(menu_items):
+                self._build_row(rownum, menuitem, conflicts)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+        
+        self._resize_status_column()
+        
+        # Reapply filters after populating (to respect filter toggle states)
+        self.filter_entries()
 
-                widget.keySequenceChanged.connect(lambda menu_item=menuitem, w=widget: self.setkey(menuitem=menu_item,
-                                                                                                   shortcut_widget=w))
-            
-            # Status badge (column 1)
-            status_badge = self._create_status_badge(status)
-            self.table.setCellWidget(rownum, 1, status_badge)
-            
-            # Menu location (column 2)
-            if menuitem.get('orphaned', False):
-                label_text = "%s (menu: %s) [Missing]" % (menuitem['menupath'], menuitem['top_menu_name'])
-            else:
-                label_text = "%s (menu: %s)" % (menuitem['menupath'], menuitem['top_menu_name'])
-            self.table.setCellWidget(rownum, 2, QtWidgets.QLabel(label_text))
-            
-            # Apply conflict highlighting (subtle red-tinted background)
-            if conflicting_commands:
-                for col in range(3):
-                    item = self.table.item(rownum, col)
-                    if item is None:
-                        item = QtWidgets.QTableWidgetItem()
-                        self.table.setItem(rownum, col, item)
-                    item.setBackground(QtGui.QColor(STATUS_COLORS['CONFLICT_BG']))
+    def _build_row(self, rownum, menuitem, conflicts):
+        """(Re)create the table items for one row
+        """
+        cmd_key = menuitem['cmd_key']
+        status = menuitem['_status']
+        is_conflicted = cmd_key in conflicts
         
-        # Auto-resize Status column to fit content (ensure all status text is visible)
-        # Process events to ensure widgets are rendered before measuring
-        QtWidgets.QApplication.processEvents()
+        # Shortcut column (a KeySequenceWidget editor is only created
+        # by ShortcutDelegate while the cell is being edited, and its
+        # tooltip by ShortcutDelegate.helpEvent on hover)
+        shortcut = self._current_shortcut(menuitem)
+        shortcut_item = QtWidgets.QTableWidgetItem(shortcut.toString(QtGui.QKeySequence.NativeText))
+        self.table.setItem(rownum, 0, shortcut_item)
+        
+        # Status badge (column 1)
+        self.table.setItem(rownum, 1, self._create_status_item(status))
+        
+        # Menu location (column 2)
+        if menuitem.get('orphaned', False):
+            label_text = "%s (menu: %s) [Missing]" % (menuitem['menupath'], menuitem['top_menu_name'])
+        else:
+            label_text = "%s (menu: %s)" % (menuitem['menupath'], menuitem['top_menu_name'])
+        location_item = QtWidgets.QTableWidgetItem(label_text)
+        location_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+        self.table.setItem(rownum, 2, location_item)
+        
+        # Apply conflict highlighting (subtle red-tinted background)
+        if is_conflicted:
+            for col in range(3):
+                self.table.item(rownum, col).setBackground(QtGui.QColor(STATUS_COLORS['CONFLICT_BG']))
+
+    def _resize_status_column(self):
+        # Auto-resize Status column to fit content (ensure all status text is visible).
+        # Measured from the items' size hints, so no need to process events first
         self.table.resizeColumnToContents(1)
         # Add padding to prevent text cutoff and improve readability
         current_width = self.table.columnWidth(1)
         if current_width > 0:
             self.table.setColumnWidth(1, current_width + 12)  # Add 12px padding for margins
-        
-        # Reapply filters after populating (to respect filter toggle states)
-        self.filter_entries()
 
     def setkey(self, menuitem, shortcut_widget):
         """Called when shortcut is edited
@@ -1172,43 +1593,46 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
         Updates the Nuke menu, and puts the key in the Overrides setting-thing
         """
 
+        # Menu items whose row needs refreshing afterwards
+        affected_items = []
+
         # Check if shortcut is already assigned to something else:
         shortcut_str = shortcut_widget.shortcut().toString()
-        menu_items = self.list_menu()
-        for index, other_item in enumerate(menu_items):
-            # Skip orphaned items when checking conflicts (they can't have active shortcuts)
-            if other_item.get('orphaned', False):
+        self.list_menu()  # Make sure the shortcut index is built
+        if shortcut_str:
+            # Only items already using this shortcut need checking. Copied (and
+            # kept in table order) since the index changes as shortcuts are cleared
+            candidates = sorted(self._shortcut_to_items.get(shortcut_str, ()),
+                                key=lambda item: self._row_for_item[id(item)])
+        else:
+            candidates = []
+        for other_item in candidates:
+            if other_item is menuitem:
                 continue
-                
-            other_sc = other_item['menuobj'].action().shortcut()
-            if hasattr(other_sc, 'toString'):
-                other_sc = other_sc.toString()
-            else:
-                other_sc = QtGui.QKeySequence(other_sc).toString()
-
-            if shortcut_str and other_sc == shortcut_str and other_item is not menuitem:
-                answer = self._confirm_override(other_item, shortcut_str)
-                if answer is None:
-                    # Cancel editing - reset widget to original key then stop
-                    if not menuitem.get('orphaned', False):
-                        shortcut_widget.setShortcut(QtGui.QKeySequence(menuitem['menuobj'].action().shortcut()))
-                    else:
-                        # For orphaned items, reset to the stored shortcut_str
-                        shortcut_widget.setShortcut(QtGui.QKeySequence(menuitem.get('shortcut_str', '')))
-                    return
-                elif answer is True:
-                    # Un-assign the shortcut first
-                    if not other_item.get('orphaned', False):
-                        other_item['menuobj'].setShortcut('')
-                    other_cmd_key = "%s/%s" % (other_item['top_menu_name'], other_item['menupath'])
-                    self.settings.overrides[other_cmd_key] = ""
-                    # Update user prefs map for "show only changed" filter
-                    self._user_prefs_map[other_cmd_key] = ""
-                    if self.table.cellWidget(index, 0):
-                        self.table.cellWidget(index, 0).setShortcut(QtGui.QKeySequence(""))
-                elif answer is False:
-                    # Keep both shortcuts
-                    pass
+            answer = self._confirm_override(other_item, shortcut_str)
+            if answer is None:
+                # Cancel editing - reset widget to original key then stop
+                # (for orphaned items, that's the stored shortcut_str)
+                shortcut_widget.setShortcut(self._current_shortcut(menuitem))
+                # Holders already cleared before the Cancel stay cleared,
+                # so their rows still need refreshing
+                self._refresh_rows(affected_items)
+                return
+            elif answer is True:
+                # Un-assign the shortcut first
+                if not other_item.get('orphaned', False):
+                    other_item['menuobj'].setShortcut('')
+                other_cmd_key = other_item['cmd_key']
+                self.settings.overrides[other_cmd_key] = ""
+                # Update user prefs map for "show only changed" filter
+                self._user_prefs_map[other_cmd_key] = ""
+                self._effective_cache.pop(other_cmd_key, None)
+                self._update_status(other_item)
+                self._update_shortcut_str(other_item)
+                affected_items.extend(self._update_conflict_index(other_item))
+            elif answer is False:
+                # Keep both shortcuts
+                pass
 
         # Handle shortcut assignment
         # For orphaned items, we can't apply to Nuke, but we can update preferences
@@ -1216,15 +1640,36 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
         if not menuitem.get('orphaned', False):
             # Normal menu item - apply to Nuke
             menuitem['menuobj'].setShortcut(shortcut_str)
+        else:
+            # Orphaned item - its placeholder shows the shortcut from prefs,
+            # and the item list is kept across edits, so update it here
+            menuitem['shortcut_str'] = shortcut_str
         
-        cmd_key = "%s/%s" % (menuitem['top_menu_name'], menuitem['menupath'])
+        cmd_key = menuitem['cmd_key']
         self.settings.overrides[cmd_key] = shortcut_str
         # Update user prefs map for "show only changed" filter
         self._user_prefs_map[cmd_key] = shortcut_str
-        
-        # Invalidate cache and refresh table to update status/conflict indicators
-        self._cache_items = None
-        self.populate()  # populate() will call filter_entries() at the end
+        self._effective_cache.pop(cmd_key, None)
+        self._update_status(menuitem)
+        self._update_shortcut_str(menuitem)
+        affected_items.extend(self._update_conflict_index(menuitem))
+        self._refresh_rows(affected_items)
+
+    def _refresh_rows(self, affected_items):
+        """Rebuild the rows of items whose shortcut, status or conflicts changed
+
+        The item list itself is unchanged (editing never adds or removes menu
+        items), so the rest of the table is still valid
+        """
+        conflicts = self._conflicts_from_index()
+        for item in affected_items:
+            rownum = self._row_for_item.get(id(item))
+            if rownum is not None:
+                self._build_row(rownum, item, conflicts)
+        self._resize_status_column()
+        # Status and shortcuts changed, so the filters must be re-run
+        self._last_filter_state = None
+        self.filter_entries()
 
     def _confirm_override(self, menu_item, shortcut):
         """Ask the user if they are sure they want to override the shortcut
@@ -1279,6 +1724,9 @@ class ShortcutEditorWidget(QtWidgets.QDialog):
             self.settings.clear()
             # Clear user prefs map since all overrides are cleared
             self._user_prefs_map = {}
+            self._effective_cache = {}
+            self._conflict_index = None
+            self._conflicts_cache = None
             self.close()
             QtWidgets.QMessageBox.information(None, "Reset complete", "You must restart Nuke for this to take effect")
         elif ret == QtWidgets.QMessageBox.Cancel: